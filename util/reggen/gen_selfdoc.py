@@ -10,9 +10,9 @@ from reggen import (validate,
                     ip_block, enum_entry, field,
                     register, multi_register, window)
 
-
-def genout(outfile, msg):
-    outfile.write(msg)
+# Flattened views of the (static) validate tables used when rendering rows
+_KEY_USE = validate.key_use
+_VAL_TYPE = {k: v[0] for k, v in validate.val_types.items()}
 
 
 doc_intro = """
@@ -199,108 +199,92 @@ doc_tail = """
 
 """
 
-
-def doc_tbl_head(outfile, use):
+# Each keyed table in the document: all of the static text since the
+# previous table (fused so it is emitted in one go) and the dictionaries,
+# with their key use, that populate it.
+_SECTIONS = (
+    ("\n\nThe top level of the JSON is a group containing "
+     "the following keys:\n",
+     [(ip_block.REQUIRED_FIELDS, 'r'), (ip_block.OPTIONAL_FIELDS, 'o')]),
+    (top_example +
+     "\n\nThe list of registers includes register definition "
+     "groups containing the following keys:\n",
+     [(register.REQUIRED_FIELDS, 'r'), (register.OPTIONAL_FIELDS, 'o')]),
+    (register_example +
+     "\n\nIn the fields list each field definition is a group "
+     "itself containing the following keys:\n",
+     [(field.REQUIRED_FIELDS, 'r'), (field.OPTIONAL_FIELDS, 'o')]),
+    (field_example +
+     "\n\nDefinitions in an enumeration group contain:\n",
+     [(enum_entry.REQUIRED_FIELDS, 'r')]),
+    ("\n\nThe list of registers may include single entry groups "
+     "to control the offset, open a window or generate registers:\n",
+     [(validate.list_optone, 'o')]),
+    (offset_intro + regwen_intro + window_intro,
+     [(window.REQUIRED_FIELDS, 'r'), (window.OPTIONAL_FIELDS, 'o')]),
+    (multi_intro,
+     [(multi_register.REQUIRED_FIELDS, 'r'),
+      (multi_register.OPTIONAL_FIELDS, 'o')]),
+)
+
+
+def doc_tbl_head(buf, use):
     if use is not None:
-        genout(outfile, "\nKey | Kind | Type | Description of Value\n")
-        genout(outfile, "--- | ---- | ---- | --------------------\n")
+        buf.append("\nKey | Kind | Type | Description of Value\n"
+                   "--- | ---- | ---- | --------------------\n")
     else:
-        genout(outfile, "\nKey | Description\n")
-        genout(outfile, "--- | -----------\n")
+        buf.append("\nKey | Description\n"
+                   "--- | -----------\n")
 
 
-def doc_tbl_line(outfile, key, use, desc):
-    if use is not None:
+def doc_tbl_line(key, kind, desc):
+    if kind is not None:
         desc_key, desc_txt = desc
-        val_type = (validate.val_types[desc_key][0]
-                    if desc_key is not None else None)
+        if desc_key is not None:
+            return f'{key} | {kind} | {_VAL_TYPE[desc_key]} | {desc_txt}\n'
     else:
         assert isinstance(desc, str)
-        val_type = None
         desc_txt = desc
 
-    if val_type is not None:
-        genout(
-            outfile, '{} | {} | {} | {}\n'.format(key, validate.key_use[use],
-                                                  val_type, desc_txt))
-    else:
-        genout(outfile, key + " | " + desc_txt + "\n")
+    return f'{key} | {desc_txt}\n'
+
+
+def _render_rows(fields, use):
+    kind = _KEY_USE[use]
+    return ''.join(doc_tbl_line(k, kind, v) for k, v in fields.items())
+
+
+def _render():
+    buf = []
+    buf.append(doc_intro)
+    buf.append(''.join(f'{type_str} | {type_desc}\n'
+                       for type_str, type_desc in validate.val_types.values()))
+
+    buf.append(swaccess_intro)
+    doc_tbl_head(buf, None)
+    buf.append(''.join(doc_tbl_line(k, None, v[0])
+                       for k, v in SWACCESS_PERMITTED.items()))
+
+    buf.append(hwaccess_intro)
+    doc_tbl_head(buf, None)
+    buf.append(''.join(doc_tbl_line(k, None, v[0])
+                       for k, v in HWACCESS_PERMITTED.items()))
+
+    for intro, groups in _SECTIONS:
+        buf.append(intro)
+        doc_tbl_head(buf, 1)
+        for fields, use in groups:
+            buf.append(_render_rows(fields, use))
+
+    buf.append(doc_tail)
+
+    return buf
+
+
+# The rendered document, as a list of fragments. This only depends on static
+# tables, so it is generated once at import and document() just writes it.
+_DOC_PARTS = _render()
 
 
 def document(outfile):
-    genout(outfile, doc_intro)
-    for x in validate.val_types:
-        genout(
-            outfile,
-            validate.val_types[x][0] + " | " + validate.val_types[x][1] + "\n")
-
-    genout(outfile, swaccess_intro)
-    doc_tbl_head(outfile, None)
-    for key, value in SWACCESS_PERMITTED.items():
-        doc_tbl_line(outfile, key, None, value[0])
-
-    genout(outfile, hwaccess_intro)
-    doc_tbl_head(outfile, None)
-    for key, value in HWACCESS_PERMITTED.items():
-        doc_tbl_line(outfile, key, None, value[0])
-
-    genout(
-        outfile, "\n\nThe top level of the JSON is a group containing "
-        "the following keys:\n")
-    doc_tbl_head(outfile, 1)
-    for k, v in ip_block.REQUIRED_FIELDS.items():
-        doc_tbl_line(outfile, k, 'r', v)
-    for k, v in ip_block.OPTIONAL_FIELDS.items():
-        doc_tbl_line(outfile, k, 'o', v)
-    genout(outfile, top_example)
-
-    genout(
-        outfile, "\n\nThe list of registers includes register definition "
-        "groups containing the following keys:\n")
-    doc_tbl_head(outfile, 1)
-    for k, v in register.REQUIRED_FIELDS.items():
-        doc_tbl_line(outfile, k, 'r', v)
-    for k, v in register.OPTIONAL_FIELDS.items():
-        doc_tbl_line(outfile, k, 'o', v)
-    genout(outfile, register_example)
-
-    genout(
-        outfile, "\n\nIn the fields list each field definition is a group "
-        "itself containing the following keys:\n")
-    doc_tbl_head(outfile, 1)
-    for k, v in field.REQUIRED_FIELDS.items():
-        doc_tbl_line(outfile, k, 'r', v)
-    for k, v in field.OPTIONAL_FIELDS.items():
-        doc_tbl_line(outfile, k, 'o', v)
-    genout(outfile, field_example)
-
-    genout(outfile, "\n\nDefinitions in an enumeration group contain:\n")
-    doc_tbl_head(outfile, 1)
-    for k, v in enum_entry.REQUIRED_FIELDS.items():
-        doc_tbl_line(outfile, k, 'r', v)
-
-    genout(
-        outfile, "\n\nThe list of registers may include single entry groups "
-        "to control the offset, open a window or generate registers:\n")
-    doc_tbl_head(outfile, 1)
-    for x in validate.list_optone:
-        doc_tbl_line(outfile, x, 'o', validate.list_optone[x])
-
-    genout(outfile, offset_intro)
-    genout(outfile, regwen_intro)
-
-    genout(outfile, window_intro)
-    doc_tbl_head(outfile, 1)
-    for k, v in window.REQUIRED_FIELDS.items():
-        doc_tbl_line(outfile, k, 'r', v)
-    for k, v in window.OPTIONAL_FIELDS.items():
-        doc_tbl_line(outfile, k, 'o', v)
-
-    genout(outfile, multi_intro)
-    doc_tbl_head(outfile, 1)
-    for k, v in multi_register.REQUIRED_FIELDS.items():
-        doc_tbl_line(outfile, k, 'r', v)
-    for k, v in multi_register.OPTIONAL_FIELDS.items():
-        doc_tbl_line(outfile, k, 'o', v)
-
-    genout(outfile, doc_tail)
+    outfile.writelines(_DOC_PARTS)